@@ -14,12 +14,14 @@ Data Sources:
 """
 
 import streamlit as st
-import pandas as pd
 import sqlite3
-from typing import Optional, List, Tuple
+from html import escape
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 # Configuration constants
 GEOPACKAGE_PATH = "data/geological_data.gpkg"  # Single data source file
+STYLES_PATH = "static/styles.css"  # Theme-aware page styles
 FOUNDATION_TYPES = ["Piles", "Suction Caisson", "GBS", "Cables"]  # Available foundation types
 FOUNDATION_COLUMN_MAP = {  # Maps foundation types to database column names
     "Piles": "Piles_Assessment",
@@ -27,6 +29,9 @@ FOUNDATION_COLUMN_MAP = {  # Maps foundation types to database column names
     "GBS": "GBS_Assessment",
     "Cables": "Cables_Assessment"
 }
+EXCLUDED_CONSTRAINT_COLUMNS = frozenset({  # Meta-columns in the constraint tables that aren't actual constraints
+    'Unknown', 'Potentially unsuitable', 'Requires individual WTG siting investigation'
+})
 
 # Page configuration
 st.set_page_config(
@@ -36,542 +41,258 @@ st.set_page_config(
 )
 
 # Data loading functions
-@st.cache_data
-def load_geological_data() -> pd.DataFrame:
-    """Load main geological data from GeoPackage.
+@st.cache_resource
+def get_connection() -> sqlite3.Connection:
+    """Open the read connection to the GeoPackage shared by all loaders and sessions.
 
     Returns:
-        DataFrame containing geological features with all attributes
+        Read-only SQLite connection
+
+    Raises:
+        FileNotFoundError: If the GeoPackage does not exist
+    """
+    # mode=ro reports a missing file as a generic OperationalError, so check for it first
+    if not Path(GEOPACKAGE_PATH).exists():
+        raise FileNotFoundError(GEOPACKAGE_PATH)
+
+    # mode=ro takes no write locks and never creates an empty file
+    conn = sqlite3.connect(f"file:{GEOPACKAGE_PATH}?mode=ro", uri=True, check_same_thread=False)
+    conn.execute('PRAGMA mmap_size = 268435456')  # Map the file instead of copying pages into the cache
+    conn.execute('PRAGMA cache_size = -64000')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    return conn
+
+def read_records(conn: sqlite3.Connection, query: str) -> Dict[str, Dict[str, Any]]:
+    """Run a query and index its rows by the value in the first column.
+
+    Args:
+        conn: Open GeoPackage connection
+        query: SELECT statement whose first column holds the feature names
+
+    Returns:
+        Dictionary mapping feature name to a {column: value} record, with text
+        values stripped and NULLs as None; the first row wins when a name is duplicated
+    """
+    cursor = conn.execute(query)
+    columns = [description[0] for description in cursor.description]
+    records = {}
+    for row in cursor.fetchall():
+        values = [value.strip() if isinstance(value, str) else value for value in row]
+        records.setdefault(values[0], dict(zip(columns, values)))
+    return records
+
+def read_feature_table(conn: sqlite3.Connection) -> Dict[str, Dict[str, Any]]:
+    """Read the main geological features table.
+
+    Args:
+        conn: Open GeoPackage connection
+
+    Returns:
+        Dictionary mapping feature name to its record with all attributes
+    """
+    # Explicitly quote "References" as it's a SQL reserved keyword
+    return read_records(conn, '''
+        SELECT
+            Geological_Feature, Setting, Constraint_Type, Definition,
+            Piles_Assessment, Suction_Caisson_Assessment, GBS_Assessment, Cables_Assessment,
+            Dominant_Constraint, Comments, "References"
+        FROM geological_features
+    ''')
+
+def read_constraint_table(conn: sqlite3.Connection, table_name: str) -> Dict[str, Dict[str, Any]]:
+    """Read a constraint table, leaving out the meta-columns at the SQL level.
+
+    Args:
+        conn: Open GeoPackage connection
+        table_name: Name of the constraint table
+
+    Returns:
+        Dictionary mapping feature name to its {column: value} record, the
+        feature name column followed by the constraint columns
+    """
+    columns = [row[1] for row in conn.execute(f'PRAGMA table_info("{table_name}")')]
+    if not columns:
+        raise sqlite3.OperationalError(f"no such table: {table_name}")
+    selected = columns[:1] + [col for col in columns[1:] if col.strip() not in EXCLUDED_CONSTRAINT_COLUMNS]
+    column_sql = ', '.join('"{}"'.format(col.replace('"', '""')) for col in selected)
+    return read_records(conn, f'SELECT {column_sql} FROM "{table_name}"')
+
+class GeoPackageData(NamedTuple):
+    """The three GeoPackage tables used by the app, indexed by feature name."""
+    features: Dict[str, Dict[str, Any]]
+    geo_constraints: Dict[str, Dict[str, Any]]
+    eng_constraints: Dict[str, Dict[str, Any]]
+
+def load_table(description: str, reader: Callable[..., Dict[str, Dict[str, Any]]], *args: Any) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Read one table with its own error handling, so a broken table does not hide the others.
+
+    Args:
+        description: What the table holds, for error messages
+        reader: Function reading the table from the connection
+        *args: Extra arguments for the reader
+
+    Returns:
+        The reader's records, or None if loading failed
     """
     try:
-        with sqlite3.connect(GEOPACKAGE_PATH) as conn:
-            # Explicitly quote "References" as it's a SQL reserved keyword
-            df = pd.read_sql_query('''
-                SELECT
-                    Geological_Feature, Setting, Constraint_Type, Definition,
-                    Piles_Assessment, Suction_Caisson_Assessment, GBS_Assessment, Cables_Assessment,
-                    Dominant_Constraint, Comments, "References"
-                FROM geological_features
-            ''', conn)
-        return df
+        return reader(get_connection(), *args)
     except FileNotFoundError:
         st.error(f"{GEOPACKAGE_PATH} not found. Please ensure the data file is in the correct location.")
-        return pd.DataFrame()
     except sqlite3.DatabaseError as e:
-        st.error(f"Database error loading geological data: {e}")
-        return pd.DataFrame()
+        st.error(f"Database error loading {description}: {e}")
     except Exception as e:
-        st.error(f"Error loading geological data from GeoPackage: {e}")
-        return pd.DataFrame()
+        st.error(f"Error loading {description} from GeoPackage: {e}")
+    return None
 
-@st.cache_data
-def load_constraint_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """Load constraint data from GeoPackage.
+@st.cache_resource
+def load_geopackage_data() -> GeoPackageData:
+    """Load all GeoPackage tables over the shared connection in one cached call.
+
+    The records are read-only, so they and the lookups derived from them are
+    cached as shared resources rather than unpickled into a fresh copy on
+    every run.
 
     Returns:
-        Tuple of (geological_constraints, engineering_constraints) DataFrames
+        GeoPackageData with the features, geological and engineering constraint
+        records (a table that fails to load is empty)
     """
-    try:
-        with sqlite3.connect(GEOPACKAGE_PATH) as conn:
-            geo_constraints = pd.read_sql_query("SELECT * FROM geological_constraints", conn)
-            eng_constraints = pd.read_sql_query("SELECT * FROM engineering_constraints", conn)
-        return geo_constraints, eng_constraints
-    except sqlite3.DatabaseError as e:
-        st.error(f"Database error loading constraint data: {e}")
-        return pd.DataFrame(), pd.DataFrame()
-    except Exception as e:
-        st.error(f"Error loading constraint data from GeoPackage: {e}")
-        return pd.DataFrame(), pd.DataFrame()
+    if not Path(GEOPACKAGE_PATH).exists():
+        st.error(f"{GEOPACKAGE_PATH} not found. Please ensure the data file is in the correct location.")
+        return GeoPackageData({}, {}, {})
 
-# Load all data
-geological_data = load_geological_data()
-geo_constraints_data, eng_constraints_data = load_constraint_data()
+    tables = (
+        load_table("geological data", read_feature_table),
+        load_table("geological constraint data", read_constraint_table, "geological_constraints"),
+        load_table("engineering constraint data", read_constraint_table, "engineering_constraints"),
+    )
+    return GeoPackageData(*(table if table is not None else {} for table in tables))
 
-# Extract geological features list
-if not geological_data.empty:
-    GEOLOGICAL_FEATURES = sorted(geological_data['Geological_Feature'].dropna().unique().tolist())
-else:
-    GEOLOGICAL_FEATURES = ["No features available"]
+@st.cache_resource
+def load_feature_list() -> Tuple[str, ...]:
+    """Build the sorted, de-duplicated list of feature names once per data load.
 
-# Styling - Theme-aware colors
-st.markdown("""
-<style>
-    /* Header styles */
-    .main-header {
-        background-color: #1e4d5b;
-        color: white;
-        padding: 1rem;
-        margin: -1rem -1rem 2rem -1rem;
-        text-align: center;
-    }
-
-    .nav-links {
-        float: right;
-        margin-top: -0.5rem;
-    }
-
-    .nav-links a {
-        color: white;
-        text-decoration: none;
-        margin-left: 2rem;
-        transition: opacity 0.2s ease, text-decoration 0.2s ease;
-    }
-
-    .nav-links a:hover {
-        opacity: 0.8;
-        text-decoration: underline;
-    }
-
-    /* Section headers */
-    .section-header {
-        background-color: #1e4d5b;
-        color: white;
-        padding: 0.5rem;
-        text-align: center;
-        font-weight: bold;
-        margin: 1rem 0 0.5rem 0;
-    }
-
-    /* Feature headers */
-    .foundation-header {
-        text-align: center;
-        font-size: 1.5rem;
-        font-weight: bold;
-        padding: 1rem;
-        margin: 0rem 0;
-        color: white;
-    }
-
-    .cables-header {
-        background-color: #a0916a;
-    }
-
-    .pipelines-header {
-        background-color: #c4949c;
-    }
-
-    /* Content containers - theme aware */
-    .section-container, .constraints-card {
-        background-color: rgba(128, 128, 128, 0.1);
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 0 5px 5px 0;
-        min-height: 100px;
-        display: flex;
-        flex-direction: column;
-        justify-content: flex-start;
-    }
-
-    /* Color-coded left borders for each feature */
-    .section-container:has(.feature-label-1),
-    .constraints-card:has(.feature-label-1) {
-        border-left: 3px solid #a0916a;
-    }
-
-    .section-container:has(.feature-label-2),
-    .constraints-card:has(.feature-label-2) {
-        border-left: 3px solid #c4949c;
-    }
-
-    /* Feature context labels */
-    .feature-label {
-        font-size: 0.75rem;
-        font-weight: 600;
-        padding: 0.25rem 0.5rem;
-        margin: -1rem -1rem 0.75rem -1rem;
-        border-radius: 0 5px 0 0;
-        color: white;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-
-    .feature-label-1 {
-        background-color: #a0916a;
-    }
-
-    .feature-label-2 {
-        background-color: #c4949c;
-    }
-
-    /* Constraint pills - theme aware */
-    .constraint-pill {
-        display: inline-block;
-        padding: 0.2rem 0.6rem;
-        margin: 0.2rem 0.1rem;
-        border-radius: 15px;
-        font-size: 0.8rem;
-        font-weight: 500;
-        text-align: center;
-    }
-
-    .geo-constraint-pill {
-        background-color: rgba(33, 150, 243, 0.15);
-        border: 1px solid #2196f3;
-        color: #2196f3;
-    }
-
-    .eng-constraint-pill {
-        background-color: rgba(255, 152, 0, 0.15);
-        border: 1px solid #ff9800;
-        color: #ff9800;
-    }
-
-    /* Dark mode adjustments */
-    [data-theme="dark"] .geo-constraint-pill {
-        background-color: rgba(33, 150, 243, 0.25);
-        color: #64b5f6;
-    }
-
-    [data-theme="dark"] .eng-constraint-pill {
-        background-color: rgba(255, 152, 0, 0.25);
-        color: #ffb74d;
-    }
-
-    .constraints-container {
-        margin: 0.5rem 0;
-        line-height: 1.8;
-    }
-
-    .constraint-subheading {
-        font-weight: bold;
-        margin: 0.8rem 0 0.5rem 0;
-        color: #1e4d5b;
-        font-size: 0.95rem;
-    }
-
-    [data-theme="dark"] .constraint-subheading {
-        color: #64b5f6;
-    }
-
-    .constraint-subheading:first-child {
-        margin-top: 0;
-    }
-
-    /* References card styling - subtle and less prominent */
-    .references-card {
-        background-color: rgba(128, 128, 128, 0.05);
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 0 5px 5px 0;
-        border-left: 3px solid rgba(128, 128, 128, 0.3);
-        font-size: 0.85rem;
-        line-height: 1.6;
-        display: flex;
-        flex-direction: column;
-        justify-content: flex-start;
-    }
-
-    [data-theme="dark"] .references-card {
-        background-color: rgba(128, 128, 128, 0.08);
-    }
-
-    /* Color-coded left borders for reference cards - match other cards */
-    .references-card:has(.feature-label-1) {
-        border-left: 3px solid #a0916a;
-    }
-
-    .references-card:has(.feature-label-2) {
-        border-left: 3px solid #c4949c;
-    }
-
-    .references-card .feature-label {
-        opacity: 0.8;
-    }
-
-    .references-card p {
-        color: rgba(100, 100, 100, 1);
-        margin: 0.25rem 0 !important;
-        font-size: 0.85rem;
-    }
-
-    [data-theme="dark"] .references-card p {
-        color: rgba(180, 180, 180, 0.85);
-    }
-
-    /* Compact references subheading */
-    .references-subheading {
-        font-weight: 600;
-        font-size: 0.75rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        color: rgba(128, 128, 128, 0.75);
-        margin-top: 0 !important;
-        margin-bottom: 0.4rem !important;
-    }
-
-    [data-theme="dark"] .references-subheading {
-        color: rgba(180, 180, 180, 0.6);
-    }
-
-    /* Global resets */
-    p {
-        margin-bottom: 0.5rem !important;
-        margin-top: 0rem !important;
-    }
-
-    .stSelectbox, .stSelectbox > label, .stSelectbox > div {
-        margin-top: 0rem !important;
-        margin-bottom: 0rem !important;
-        cursor: pointer !important;
-    }
-
-    .stSelectbox > div > div {
-        cursor: pointer !important;
-    }
-
-    .stSelectbox select {
-        cursor: pointer !important;
-    }
-
-    .stSelectbox [data-baseweb="select"] {
-        cursor: pointer !important;
-    }
-
-    .stButton > button {
-        text-align: center !important;
-    }
-
-    .stButton > button > p, .stButton button p, .stButton p {
-        margin-bottom: 0 !important;
-        margin-top: 0 !important;
-    }
-
-    .stColumn .stButton {
-        margin-top: 1rem !important;
-    }
-
-    /* Tooltip system - theme aware */
-    .tooltip {
-        position: relative;
-        display: inline-block;
-        cursor: help;
-    }
-
-    .tooltip .tooltiptext {
-        visibility: hidden;
-        width: 300px;
-        background-color: rgba(64, 64, 64, 0.95);
-        color: #fff;
-        text-align: left;
-        border-radius: 6px;
-        padding: 8px;
-        position: absolute;
-        z-index: 1;
-        bottom: 125%;
-        left: 50%;
-        margin-left: -150px;
-        opacity: 0;
-        transition: opacity 0.3s;
-        font-size: 12px;
-        line-height: 1.4;
-    }
-
-    .tooltip:hover .tooltiptext {
-        visibility: visible;
-        opacity: 1;
-    }
-
-    .tooltip .tooltiptext::after {
-        content: "";
-        position: absolute;
-        top: 100%;
-        left: 50%;
-        margin-left: -5px;
-        border-width: 5px;
-        border-style: solid;
-        border-color: rgba(64, 64, 64, 0.95) transparent transparent transparent;
-    }
-
-    /* Terms Modal */
-    .terms-modal {
-        display: none;
-        position: fixed;
-        z-index: 1000;
-        left: 0;
-        top: 0;
-        width: 100%;
-        height: 100%;
-        background-color: rgba(0,0,0,0.4);
-    }
-
-    .terms-modal:target {
-        display: block;
-    }
-
-    .terms-modal-content {
-        background-color: white;
-        color: #262730;
-        margin: 10% auto;
-        padding: 30px 40px;
-        border-radius: 8px;
-        width: 80%;
-        max-width: 700px;
-        max-height: 70vh;
-        overflow-y: auto;
-        position: relative;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        line-height: 1.6;
-    }
-
-    [data-theme="dark"] .terms-modal-content {
-        background-color: #262730;
-        color: #fafafa;
-    }
-
-    .terms-modal-content h3 {
-        color: #1e4d5b;
-    }
-
-    [data-theme="dark"] .terms-modal-content h3 {
-        color: #64b5f6;
-    }
-
-    .terms-modal-content p {
-        color: inherit;
-    }
-
-    .terms-close {
-        position: absolute;
-        right: 20px;
-        top: 15px;
-        font-size: 24px;
-        font-weight: bold;
-        text-decoration: none !important;
-        color: #666;
-        cursor: pointer;
-    }
-
-    .terms-close:hover {
-        color: #000;
-        text-decoration: none !important;
-    }
-
-    [data-theme="dark"] .terms-close {
-        color: #999;
-    }
-
-    [data-theme="dark"] .terms-close:hover {
-        color: #fafafa;
-        text-decoration: none !important;
-    }
-
-    .terms-modal-background {
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        z-index: -1;
-    }
-</style>
-""", unsafe_allow_html=True)
+    Returns:
+        Tuple of geological feature names for the selection widgets
+    """
+    feature_names = [name for name in load_geopackage_data().features if name is not None]
+    if not feature_names:
+        return ("No features available",)
+    return tuple(sorted(feature_names))
 
-# Helper functions
-def create_tooltip(text: str, tooltip_content: str) -> str:
-    """Create a tooltip with hover functionality.
-
-    Args:
-        text: The visible text to display
-        tooltip_content: The content to show on hover
+@st.cache_resource
+def load_foundation_assessments() -> Dict[str, Dict[str, str]]:
+    """Precompute the assessment text for every feature and foundation type.
 
     Returns:
-        HTML string with tooltip markup
+        Dictionary mapping feature name to a {foundation type: assessment} dictionary
     """
-    return f'<span class="tooltip">{text}<span class="tooltiptext">{tooltip_content}</span></span>'
+    assessments = {}
+    for feature_name, record in load_geopackage_data().features.items():
+        feature_assessments = {}
+        for foundation_type, col_name in FOUNDATION_COLUMN_MAP.items():
+            if col_name not in record:
+                feature_assessments[foundation_type] = "Assessment not available"
+            elif record[col_name] is None:
+                feature_assessments[foundation_type] = "No assessment available"
+            else:
+                feature_assessments[foundation_type] = record[col_name]
+        assessments[feature_name] = feature_assessments
+    return assessments
 
-def format_references(references_text) -> Optional[str]:
-    """Format references for display.
+def build_constraint_lists(constraint_records: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Map each feature to the constraints marked with 'x' in its row.
 
     Args:
-        references_text: References text from the References column
+        constraint_records: Records keyed by feature name, with the feature name
+            column first and one 'x'-marked column per constraint
 
     Returns:
-        Formatted references string, or None if no references
+        Dictionary mapping feature name to its list of constraint names
     """
-    if pd.isna(references_text) or not str(references_text).strip():
-        return None
-    return str(references_text).strip()
+    constraint_lists = {}
+    for feature_name, record in constraint_records.items():
+        # All columns except the first are constraints (meta-columns are dropped when read)
+        constraint_columns = list(record)[1:]
+        constraint_lists[feature_name] = [
+            col for col in constraint_columns
+            if col.strip() and isinstance(record[col], str) and record[col].lower() == 'x'
+        ]
+    return constraint_lists
+
+@st.cache_resource
+def load_constraint_lists() -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """Precompute the constraints that apply to each feature.
 
-def get_complete_feature_data(feature_name: str) -> Optional[pd.Series]:
-    """Get complete feature data for a geological feature.
+    Returns:
+        Tuple of (geological, engineering) {feature name: constraint names} dictionaries
+    """
+    data = load_geopackage_data()
+    return build_constraint_lists(data.geo_constraints), build_constraint_lists(data.eng_constraints)
 
-    Args:
-        feature_name: Name of the geological feature
+# Load all data
+feature_index = load_geopackage_data().features
+foundation_assessments = load_foundation_assessments()
+geo_constraint_lists, eng_constraint_lists = load_constraint_lists()
+
+# Extract geological features list
+GEOLOGICAL_FEATURES = load_feature_list()
+DEFAULT_FEATURE_2_INDEX = 1 if len(GEOLOGICAL_FEATURES) > 1 else 0  # Start feature 2 on a different feature
+
+@st.cache_resource
+def load_page_styles() -> str:
+    """Read the page stylesheet once per server process.
 
     Returns:
-        Series with feature data, or None if not found
+        CSS text of the theme-aware page styles
     """
-    if geological_data.empty or feature_name == "No features match criteria":
-        return None
+    return Path(STYLES_PATH).read_text(encoding='utf-8')
 
-    # Get feature data
-    feature_data = geological_data[geological_data['Geological_Feature'] == feature_name]
-    if feature_data.empty:
-        return None
+# Styling - Theme-aware colors (re-emitted each run; Streamlit drops elements a run does not draw).
+# st.html skips the markdown pipeline, so the stylesheet is not parsed as markdown on every run.
+st.html(f"<style>{load_page_styles()}</style>")
 
-    return feature_data.iloc[0]
-
-def get_assessment(feature_data: Optional[pd.Series], foundation_type: str) -> str:
-    """Get foundation constraint assessment for a specific foundation type.
+# Helper functions
+def create_tooltip(text: str, tooltip_content: str) -> str:
+    """Create a tooltip with hover functionality.
 
     Args:
-        feature_data: Series containing feature data
-        foundation_type: Type of foundation (Piles, Suction Caisson, GBS, or Cables)
+        text: The visible text to display
+        tooltip_content: The content to show on hover
 
     Returns:
-        Assessment string
+        HTML string with tooltip markup
     """
-    if feature_data is None:
-        return "Data not available"
+    return f'<span class="tooltip">{text}<span class="tooltiptext">{tooltip_content}</span></span>'
 
-    col_name = FOUNDATION_COLUMN_MAP.get(foundation_type)
-    if col_name and col_name in feature_data:
-        return feature_data[col_name] if pd.notna(feature_data[col_name]) else "No assessment available"
-    return "Assessment not available"
+def get_complete_feature_data(feature_name: str) -> Optional[Dict[str, Any]]:
+    """Get complete feature data for a geological feature.
 
-def get_constraints_for_feature(feature_name: str, constraints_data: pd.DataFrame) -> List[str]:
-    """Extract constraints marked with 'x' for a geological feature.
+    Args:
+        feature_name: Name of the geological feature
+
+    Returns:
+        Dictionary with feature data, or None if not found
+    """
+    return feature_index.get(feature_name)
+
+def get_constraints_for_feature(feature_name: str, constraint_lists: Dict[str, List[str]]) -> List[str]:
+    """Get the constraints marked with 'x' for a geological feature.
 
     Args:
         feature_name: Name of the geological feature
-        constraints_data: DataFrame containing constraint information
+        constraint_lists: Precomputed constraint names keyed by feature name
 
     Returns:
         List of constraint names that apply to this feature
     """
-    if constraints_data.empty:
-        return []
-
-    # Find feature row using first column (exact match required)
-    first_col = constraints_data.columns[0]
-    feature_row = constraints_data[constraints_data[first_col] == feature_name]
-
-    if feature_row.empty:
-        return []
-
-    # Extract constraints from all columns except the first (which is the feature name)
-    constraints = []
-    constraint_columns = constraints_data.columns[1:]  # All columns except first are constraints
-
-    for col in constraint_columns:
-        try:
-            cell_value = feature_row[col].iloc[0]
-            if not pd.isna(cell_value) and str(cell_value).strip().lower() == 'x':
-                clean_name = col.strip()
-                # Exclude meta-columns that aren't actual constraints
-                if clean_name and clean_name not in ['Unknown', 'Potentially unsuitable', 'Requires individual WTG siting investigation']:
-                    constraints.append(clean_name)
-        except (IndexError, KeyError):
-            continue
-
-    return constraints
-
-def render_geological_characteristics_card(feature_name: str, feature_data: Optional[pd.Series], feature_label_class: str) -> str:
+    return constraint_lists.get(feature_name, [])
+
+def render_geological_characteristics_card(feature_name: str, feature_data: Optional[Dict[str, Any]], feature_label_class: str) -> str:
     """Render a geological characteristics card with definition.
 
     Args:
         feature_name: Name of the geological feature
-        feature_data: Series containing feature data
+        feature_data: Dictionary containing feature data
         feature_label_class: CSS class for feature label (e.g., 'feature-label-1')
 
     Returns:
@@ -579,24 +300,95 @@ def render_geological_characteristics_card(feature_name: str, feature_data: Opti
     """
     if feature_data is None:
         return f'''<div class="section-container">
-            <div class="feature-label {feature_label_class}">{feature_name}</div>
+            <div class="feature-label {feature_label_class}">{escape(feature_name)}</div>
             <p><strong>No data available</strong></p>
         </div>'''
 
     # Get definition
-    definition_text = feature_data['Definition'] if pd.notna(feature_data['Definition']) else "No definition available"
+    definition_text = feature_data['Definition'] if feature_data['Definition'] is not None else "No definition available"
 
     # Build HTML content
     content = f'''<div class="section-container">
-        <div class="feature-label {feature_label_class}">{feature_name}</div>
-        <p><strong>Setting:</strong> {feature_data['Setting']}</p>
-        <p><strong>Constraint Type:</strong> {feature_data['Constraint_Type']}</p>
-        <p><strong>Dominant Constraint:</strong> {feature_data['Dominant_Constraint']}</p>
-        <p><strong>Definition:</strong> {definition_text}</p>
+        <div class="feature-label {feature_label_class}">{escape(feature_name)}</div>
+        <p><strong>Setting:</strong> {escape(str(feature_data['Setting']))}</p>
+        <p><strong>Constraint Type:</strong> {escape(str(feature_data['Constraint_Type']))}</p>
+        <p><strong>Dominant Constraint:</strong> {escape(str(feature_data['Dominant_Constraint']))}</p>
+        <p><strong>Definition:</strong> {escape(definition_text)}</p>
     </div>'''
 
     return content
 
+@st.cache_data(max_entries=2 * len(GEOLOGICAL_FEATURES))
+def render_feature_card(feature_name: str, feature_label_class: str) -> Tuple[str, str, str, str, str]:
+    """Render every comparison card for one geological feature.
+
+    The cards depend only on the feature and the side it is shown on, so
+    changing one selectbox re-renders only that side; the other is a cache hit.
+
+    Args:
+        feature_name: Name of the geological feature
+        feature_label_class: CSS class for feature label (e.g., 'feature-label-1')
+
+    Returns:
+        Tuple of HTML strings: characteristics, constraints, foundation
+        assessment, engineering comments and references cards, with all
+        data text HTML-escaped
+    """
+    feature_data = get_complete_feature_data(feature_name)
+    feature_label = f'<div class="feature-label {feature_label_class}">{escape(feature_name)}</div>'
+
+    # Geological Characteristics
+    characteristics_html = render_geological_characteristics_card(feature_name, feature_data, feature_label_class)
+
+    # Constraints Analysis
+    geo_constraints = get_constraints_for_feature(feature_name, geo_constraint_lists)
+    eng_constraints = get_constraints_for_feature(feature_name, eng_constraint_lists)
+
+    parts = [feature_label, '<div class="constraint-subheading">Geological Constraints</div>']
+    if geo_constraints:
+        geo_pills = ' '.join([f'<span class="constraint-pill geo-constraint-pill">{escape(c)}</span>' for c in geo_constraints])
+        parts.append(f'<div class="constraints-container">{geo_pills}</div>')
+    else:
+        parts.append('<p style="font-style: italic; opacity: 0.6;">No geological constraints identified</p>')
+
+    parts.append('<div class="constraint-subheading">Engineering Constraints</div>')
+    if eng_constraints:
+        eng_pills = ' '.join([f'<span class="constraint-pill eng-constraint-pill">{escape(c)}</span>' for c in eng_constraints])
+        parts.append(f'<div class="constraints-container">{eng_pills}</div>')
+    else:
+        parts.append('<p style="font-style: italic; opacity: 0.6;">No engineering constraints identified</p>')
+
+    constraints_content = ''.join(parts)
+    constraints_html = f'<div class="constraints-card">{constraints_content}</div>'
+
+    # Foundation Assessment Comparison
+    if feature_data is not None:
+        assessments = foundation_assessments[feature_name]
+        parts = [feature_label]
+        parts.extend(f"<p><strong>{foundation_type}:</strong> {escape(assessments[foundation_type])}</p>"
+                     for foundation_type in FOUNDATION_TYPES)
+        foundation_content = ''.join(parts)
+        foundation_html = f'<div class="section-container">{foundation_content}</div>'
+    else:
+        foundation_html = f'<div class="section-container">{feature_label}<p><strong>No assessment data available</strong></p></div>'
+
+    # Engineering Comments
+    if feature_data is not None:
+        comments_text = feature_data['Comments'] if feature_data['Comments'] is not None else "No comments available"
+        comments_html = f'<div class="section-container">{feature_label}<p>{escape(comments_text)}</p></div>'
+    else:
+        comments_html = f'<div class="section-container">{feature_label}<p>No engineering comments available</p></div>'
+
+    # References
+    # Values are stripped at load, so an empty or missing References shows the placeholder
+    references_text = feature_data.get('References') if feature_data is not None else None
+    if references_text:
+        references_html = f'<div class="references-card">{feature_label}<p>{escape(references_text)}</p></div>'
+    else:
+        references_html = f'<div class="references-card">{feature_label}<p style="font-style: italic; opacity: 0.5;">No references available</p></div>'
+
+    return characteristics_html, constraints_html, foundation_html, comments_html, references_html
+
 # Main application layout
 st.markdown("""
 <div class="main-header">
@@ -626,164 +418,54 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-col1, col2 = st.columns([1, 3])
-
-# Left panel - Feature selection
-with col1:
-    st.header("Geological Comparison")
-    st.write("Compare two geological features and their engineering constraints for offshore windfarm development.")
-
-    st.subheader("Feature Selection")
-
-    geological_feature_1 = st.selectbox("**Geological Feature 1**", GEOLOGICAL_FEATURES, key="feature1")
-    geological_feature_2 = st.selectbox("**Geological Feature 2**", GEOLOGICAL_FEATURES,
-                                       index=1 if len(GEOLOGICAL_FEATURES) > 1 else 0, key="feature2")
-
-# Right panel - Comparison display
-with col2:
-    # Feature headers
-    col_f1, col_f2 = st.columns(2)
-
-    with col_f1:
-        st.markdown(f'<div class="foundation-header cables-header">{geological_feature_1}</div>', unsafe_allow_html=True)
-
-    with col_f2:
-        st.markdown(f'<div class="foundation-header pipelines-header">{geological_feature_2}</div>', unsafe_allow_html=True)
-
-    # Get complete feature data
-    feature_data_1 = get_complete_feature_data(geological_feature_1)
-    feature_data_2 = get_complete_feature_data(geological_feature_2)
+@st.fragment
+def render_comparison() -> None:
+    """Render the feature selectboxes and the side-by-side comparison.
 
-    # Geological Characteristics
-    st.markdown(f'<div class="section-header">{create_tooltip("Geological Characteristics", "Key geological characteristics for both selected features")}</div>',
-                unsafe_allow_html=True)
-
-    col_c1, col_c2 = st.columns(2)
-
-    with col_c1:
-        card_html = render_geological_characteristics_card(geological_feature_1, feature_data_1, 'feature-label-1')
-        st.markdown(card_html, unsafe_allow_html=True)
-
-    with col_c2:
-        card_html = render_geological_characteristics_card(geological_feature_2, feature_data_2, 'feature-label-2')
-        st.markdown(card_html, unsafe_allow_html=True)
-
-    # Constraints Analysis
-    st.markdown(f'<div class="section-header">{create_tooltip("Constraints Analysis", "Geological and engineering constraints for both features")}</div>',
-                unsafe_allow_html=True)
-
-    col_cc1, col_cc2 = st.columns(2)
-
-    with col_cc1:
-        geo_constraints_1 = get_constraints_for_feature(geological_feature_1, geo_constraints_data)
-        eng_constraints_1 = get_constraints_for_feature(geological_feature_1, eng_constraints_data)
-
-        constraints_content = f'<div class="feature-label feature-label-1">{geological_feature_1}</div>'
-        constraints_content += '<div class="constraint-subheading">Geological Constraints</div>'
-        if geo_constraints_1:
-            geo_pills = ' '.join([f'<span class="constraint-pill geo-constraint-pill">{c}</span>' for c in geo_constraints_1])
-            constraints_content += f'<div class="constraints-container">{geo_pills}</div>'
-        else:
-            constraints_content += '<p style="font-style: italic; opacity: 0.6;">No geological constraints identified</p>'
-
-        constraints_content += '<div class="constraint-subheading">Engineering Constraints</div>'
-        if eng_constraints_1:
-            eng_pills = ' '.join([f'<span class="constraint-pill eng-constraint-pill">{c}</span>' for c in eng_constraints_1])
-            constraints_content += f'<div class="constraints-container">{eng_pills}</div>'
-        else:
-            constraints_content += '<p style="font-style: italic; opacity: 0.6;">No engineering constraints identified</p>'
-
-        st.markdown(f'<div class="constraints-card">{constraints_content}</div>', unsafe_allow_html=True)
-
-    with col_cc2:
-        geo_constraints_2 = get_constraints_for_feature(geological_feature_2, geo_constraints_data)
-        eng_constraints_2 = get_constraints_for_feature(geological_feature_2, eng_constraints_data)
-
-        constraints_content = f'<div class="feature-label feature-label-2">{geological_feature_2}</div>'
-        constraints_content += '<div class="constraint-subheading">Geological Constraints</div>'
-        if geo_constraints_2:
-            geo_pills = ' '.join([f'<span class="constraint-pill geo-constraint-pill">{c}</span>' for c in geo_constraints_2])
-            constraints_content += f'<div class="constraints-container">{geo_pills}</div>'
-        else:
-            constraints_content += '<p style="font-style: italic; opacity: 0.6;">No geological constraints identified</p>'
-
-        constraints_content += '<div class="constraint-subheading">Engineering Constraints</div>'
-        if eng_constraints_2:
-            eng_pills = ' '.join([f'<span class="constraint-pill eng-constraint-pill">{c}</span>' for c in eng_constraints_2])
-            constraints_content += f'<div class="constraints-container">{eng_pills}</div>'
-        else:
-            constraints_content += '<p style="font-style: italic; opacity: 0.6;">No engineering constraints identified</p>'
-
-        st.markdown(f'<div class="constraints-card">{constraints_content}</div>', unsafe_allow_html=True)
-
-    # Foundation Assessment Comparison
-    st.markdown(f'<div class="section-header">{create_tooltip("Foundation Assessment Comparison", "Constraint levels for all foundation types for both features")}</div>',
-                unsafe_allow_html=True)
-
-    col_fa1, col_fa2 = st.columns(2)
-
-    with col_fa1:
-        if feature_data_1 is not None:
-            foundation_content = f'<div class="feature-label feature-label-1">{geological_feature_1}</div>'
-            for foundation_type in FOUNDATION_TYPES:
-                assessment = get_assessment(feature_data_1, foundation_type)
-                foundation_content += f"<p><strong>{foundation_type}:</strong> {assessment}</p>"
-            st.markdown(f'<div class="section-container">{foundation_content}</div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="section-container"><div class="feature-label feature-label-1">{geological_feature_1}</div><p><strong>No assessment data available</strong></p></div>', unsafe_allow_html=True)
-
-    with col_fa2:
-        if feature_data_2 is not None:
-            foundation_content = f'<div class="feature-label feature-label-2">{geological_feature_2}</div>'
-            for foundation_type in FOUNDATION_TYPES:
-                assessment = get_assessment(feature_data_2, foundation_type)
-                foundation_content += f"<p><strong>{foundation_type}:</strong> {assessment}</p>"
-            st.markdown(f'<div class="section-container">{foundation_content}</div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="section-container"><div class="feature-label feature-label-2">{geological_feature_2}</div><p><strong>No assessment data available</strong></p></div>', unsafe_allow_html=True)
-
-    # Engineering Comments
-    st.markdown(f'<div class="section-header">{create_tooltip("Engineering Comments", "Practical guidance and recommendations for offshore wind development")}</div>',
-                unsafe_allow_html=True)
-
-    col_e1, col_e2 = st.columns(2)
-
-    with col_e1:
-        if feature_data_1 is not None:
-            comments_text = feature_data_1['Comments'] if pd.notna(feature_data_1['Comments']) else "No comments available"
-            st.markdown(f'<div class="section-container"><div class="feature-label feature-label-1">{geological_feature_1}</div><p>{comments_text}</p></div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="section-container"><div class="feature-label feature-label-1">{geological_feature_1}</div><p>No engineering comments available</p></div>', unsafe_allow_html=True)
-
-    with col_e2:
-        if feature_data_2 is not None:
-            comments_text = feature_data_2['Comments'] if pd.notna(feature_data_2['Comments']) else "No comments available"
-            st.markdown(f'<div class="section-container"><div class="feature-label feature-label-2">{geological_feature_2}</div><p>{comments_text}</p></div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="section-container"><div class="feature-label feature-label-2">{geological_feature_2}</div><p>No engineering comments available</p></div>', unsafe_allow_html=True)
-
-    # References Section
-    st.markdown(f'<div class="section-header">{create_tooltip("References", "Academic references and citations for both features")}</div>',
-                unsafe_allow_html=True)
-
-    col_r1, col_r2 = st.columns(2)
-
-    with col_r1:
-        if feature_data_1 is not None:
-            references_text = format_references(feature_data_1.get('References'))
-            if references_text:
-                st.markdown(f'<div class="references-card"><div class="feature-label feature-label-1">{geological_feature_1}</div><p>{references_text}</p></div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="references-card"><div class="feature-label feature-label-1">{geological_feature_1}</div><p style="font-style: italic; opacity: 0.5;">No references available</p></div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="references-card"><div class="feature-label feature-label-1">{geological_feature_1}</div><p style="font-style: italic; opacity: 0.5;">No references available</p></div>', unsafe_allow_html=True)
-
-    with col_r2:
-        if feature_data_2 is not None:
-            references_text = format_references(feature_data_2.get('References'))
-            if references_text:
-                st.markdown(f'<div class="references-card"><div class="feature-label feature-label-2">{geological_feature_2}</div><p>{references_text}</p></div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="references-card"><div class="feature-label feature-label-2">{geological_feature_2}</div><p style="font-style: italic; opacity: 0.5;">No references available</p></div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="references-card"><div class="feature-label feature-label-2">{geological_feature_2}</div><p style="font-style: italic; opacity: 0.5;">No references available</p></div>', unsafe_allow_html=True)
+    Runs as a fragment, so changing a selectbox reruns only this block and
+    leaves the page styles, header and terms modal untouched. The two sides
+    share the section rows, so they rerun together; the unchanged side is
+    served from the render_feature_card cache.
+    """
+    col1, col2 = st.columns([1, 3])
+
+    # Left panel - Feature selection
+    with col1:
+        st.header("Geological Comparison")
+        st.write("Compare two geological features and their engineering constraints for offshore windfarm development.")
+
+        st.subheader("Feature Selection")
+
+        geological_feature_1 = st.selectbox("**Geological Feature 1**", GEOLOGICAL_FEATURES, key="feature1")
+        geological_feature_2 = st.selectbox("**Geological Feature 2**", GEOLOGICAL_FEATURES,
+                                           index=DEFAULT_FEATURE_2_INDEX, key="feature2")
+
+    # Right panel - Comparison display
+    with col2:
+        # Feature headers
+        st.markdown(f'''<div class="feature-headers">
+            <div class="foundation-header cables-header">{escape(geological_feature_1)}</div>
+            <div class="foundation-header pipelines-header">{escape(geological_feature_2)}</div>
+        </div>''', unsafe_allow_html=True)
+
+        # Render (or fetch from cache) the cards for each side
+        cards_1 = render_feature_card(geological_feature_1, 'feature-label-1')
+        cards_2 = render_feature_card(geological_feature_2, 'feature-label-2')
+
+        sections = [
+            ("Geological Characteristics", "Key geological characteristics for both selected features"),
+            ("Constraints Analysis", "Geological and engineering constraints for both features"),
+            ("Foundation Assessment Comparison", "Constraint levels for all foundation types for both features"),
+            ("Engineering Comments", "Practical guidance and recommendations for offshore wind development"),
+            ("References", "Academic references and citations for both features"),
+        ]
+
+        for (title, tooltip), card_html_1, card_html_2 in zip(sections, cards_1, cards_2):
+            st.markdown(f'<div class="section-header">{create_tooltip(title, tooltip)}</div>',
+                        unsafe_allow_html=True)
+
+            # Both cards go out as one element, laid side by side by the card-row grid. st.html
+            # bypasses the markdown parser, where a blank line in a card's text would end the HTML block
+            st.html(f'<div class="card-row">{card_html_1}{card_html_2}</div>')
+
+render_comparison()
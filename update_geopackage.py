@@ -20,10 +20,11 @@ Usage:
 """
 
 import sqlite3
-import pandas as pd
 from pathlib import Path
 import sys
 
+from create_geopackage import create_feature_index, read_csv_detect_encoding, write_table
+
 # Configuration constants
 DATA_DIR = "data"
 GEOPACKAGE_PATH = f"{DATA_DIR}/geological_data.gpkg"
@@ -119,40 +120,37 @@ def update_geopackage_from_csvs():
             ensure_geopackage_compliance(conn)
             
             # Update each table
+            updated_tables = []
             for table_name, file_path in CSV_FILES.items():
                 print(f"Updating {table_name} from {file_path}...")
                 
-                # Read CSV with encoding handling
-                encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-                df = None
-                
-                for encoding in encodings:
-                    try:
-                        # All CSV files now have simple structure: header in row 1, data from row 2
-                        df = pd.read_csv(file_path, encoding=encoding)
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if df is None:
-                    print(f"[ERROR] Could not read {file_path} with any supported encoding")
+                # Read CSV with encoding handling (shared with create_geopackage.py)
+                # All CSV files now have simple structure: header in row 1, data from row 2
+                try:
+                    df = read_csv_detect_encoding(file_path)
+                except UnicodeDecodeError as e:
+                    print(f"[ERROR] Could not read {file_path} with the detected encoding: {e}")
                     continue
                 
                 # Clean column names
-                df.columns = df.columns.str.strip().str.replace('\ufeff', '')
+                df.columns = [col.replace('\ufeff', '').strip() for col in df.columns]
                 
-                # Replace table data
-                df.to_sql(table_name, conn, if_exists='replace', index=False)
+                # Replace table data (bulk executemany, no per-table commit)
+                write_table(conn, table_name, df)
 
-                print(f"  + Updated {len(df)} rows in {table_name}")
+                # Replacing the table drops its index, so rebuild it
+                create_feature_index(conn, table_name, df.columns[0])
 
-                # Ensure table is registered in gpkg_contents
-                conn.execute('''
-                    INSERT OR REPLACE INTO gpkg_contents
-                    (table_name, data_type, identifier, description, last_change)
-                    VALUES (?, 'attributes', ?, ?, datetime('now','localtime'))
-                ''', (table_name, table_name, f'EGDI {table_name.replace("_", " ").title()}'))
-            
+                print(f"  + Updated {len(df)} rows in {table_name}")
+                updated_tables.append(table_name)
+
+            # Ensure updated tables are registered in gpkg_contents, in one batch
+            conn.executemany('''
+                INSERT OR REPLACE INTO gpkg_contents
+                (table_name, data_type, identifier, description, last_change)
+                VALUES (?, 'attributes', ?, ?, datetime('now','localtime'))
+            ''', [(table_name, table_name, f'EGDI {table_name.replace("_", " ").title()}')
+                  for table_name in updated_tables])
             conn.commit()
         
         print(f"\n[SUCCESS] GeoPackage updated successfully!")